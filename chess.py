@@ -1,9 +1,5 @@
 #!/usr/bin/env python
 import os
-import sys
-
-if sys.version_info[0] > 2:
-    print("This game runs on python 2 only")
 
 from chesslib import board
 
@@ -19,5 +15,4 @@ try:
     from chesslib.gui_tkinter import display
     display(game)
 except ImportError:
-    print "File 'gui_tkinter.py' is missing!"
-    
+    print("File 'gui_tkinter.py' is missing!")
@@ -0,0 +1,103 @@
+# cython: language_level=3
+"""
+    C implementation of the hottest move-generation kernels: sliding
+    attacks (first-blocker ray lookup) and the square_attacked probe.
+
+    Build in place with:
+
+        python setup.py build_ext --inplace
+
+    board.py falls back to the pure-Python versions when this extension
+    is not built, so building it is optional.
+"""
+from libc.stdint cimport uint64_t
+
+cdef extern from *:
+    int __builtin_ctzll(unsigned long long)
+    int __builtin_clzll(unsigned long long)
+
+cdef uint64_t RAYS[8][64]
+cdef uint64_t KNIGHT[64]
+cdef uint64_t KING[64]
+cdef uint64_t PAWN_W[64]
+cdef uint64_t PAWN_B[64]
+
+
+def init(rays, knight, king, pawn_white, pawn_black):
+    """
+        Copy the Python-side attack tables into C arrays.  Must be
+        called once (board.py does it at import) before any lookups.
+    """
+    cdef int d, sq
+    for d in range(8):
+        for sq in range(64):
+            RAYS[d][sq] = rays[d][sq]
+    for sq in range(64):
+        KNIGHT[sq] = knight[sq]
+        KING[sq] = king[sq]
+        PAWN_W[sq] = pawn_white[sq]
+        PAWN_B[sq] = pawn_black[sq]
+
+
+cdef uint64_t _sliding(int sq, uint64_t occ, int *dirs, int ndirs):
+    cdef uint64_t attacks = 0
+    cdef uint64_t ray, blockers
+    cdef int i, d, first
+    for i in range(ndirs):
+        d = dirs[i]
+        ray = RAYS[d][sq]
+        blockers = ray & occ
+        if blockers:
+            # Directions 0-3 run towards higher squares (blocker =
+            # lowest bit), 4-7 towards lower ones (highest bit)
+            if d < 4:
+                first = __builtin_ctzll(blockers)
+            else:
+                first = 63 - __builtin_clzll(blockers)
+            ray ^= RAYS[d][first]
+        attacks |= ray
+    return attacks
+
+
+def sliding_attacks(int sq, uint64_t occ, dirs):
+    cdef int cdirs[8]
+    cdef int n = len(dirs)
+    cdef int i
+    for i in range(n):
+        cdirs[i] = dirs[i]
+    return _sliding(sq, occ, cdirs, n)
+
+
+def square_attacked(int sq, bint by_white, bb, uint64_t occ):
+    """
+        Mirror of Board.square_attacked working on the raw bitboard
+        list; early-exits on the first attacker found.
+    """
+    cdef int offset
+    cdef int rook_dirs[4]
+    cdef int bishop_dirs[4]
+    cdef uint64_t sliders
+    if by_white:
+        offset = 0
+        if PAWN_B[sq] & <uint64_t>bb[0]:
+            return True
+    else:
+        offset = 6
+        if PAWN_W[sq] & <uint64_t>bb[6]:
+            return True
+    if KNIGHT[sq] & <uint64_t>bb[offset + 1]:
+        return True
+    if KING[sq] & <uint64_t>bb[offset + 5]:
+        return True
+    sliders = <uint64_t>bb[offset + 3] | <uint64_t>bb[offset + 4]
+    if sliders:
+        rook_dirs[0] = 0; rook_dirs[1] = 1; rook_dirs[2] = 4; rook_dirs[3] = 5
+        if _sliding(sq, occ, rook_dirs, 4) & sliders:
+            return True
+    sliders = <uint64_t>bb[offset + 2] | <uint64_t>bb[offset + 4]
+    if sliders:
+        bishop_dirs[0] = 2; bishop_dirs[1] = 3
+        bishop_dirs[2] = 6; bishop_dirs[3] = 7
+        if _sliding(sq, occ, bishop_dirs, 4) & sliders:
+            return True
+    return False
@@ -0,0 +1,1024 @@
+"""
+    Auto-generated by gen_movegen.py - do not edit by hand.
+
+    WHITE_PAWN_MOVES / BLACK_PAWN_MOVES hold one function per source
+    square taking (occ_all, enemy_occ) and returning the destination
+    bitboard, with all masks precomputed as constants.
+"""
+
+
+
+def _white_pawn_0(occ_all, enemy_occ):
+    moves = 0x200 & enemy_occ
+    if not occ_all & 0x100:
+        moves |= 0x100
+    return moves
+
+
+def _white_pawn_1(occ_all, enemy_occ):
+    moves = 0x500 & enemy_occ
+    if not occ_all & 0x200:
+        moves |= 0x200
+    return moves
+
+
+def _white_pawn_2(occ_all, enemy_occ):
+    moves = 0xa00 & enemy_occ
+    if not occ_all & 0x400:
+        moves |= 0x400
+    return moves
+
+
+def _white_pawn_3(occ_all, enemy_occ):
+    moves = 0x1400 & enemy_occ
+    if not occ_all & 0x800:
+        moves |= 0x800
+    return moves
+
+
+def _white_pawn_4(occ_all, enemy_occ):
+    moves = 0x2800 & enemy_occ
+    if not occ_all & 0x1000:
+        moves |= 0x1000
+    return moves
+
+
+def _white_pawn_5(occ_all, enemy_occ):
+    moves = 0x5000 & enemy_occ
+    if not occ_all & 0x2000:
+        moves |= 0x2000
+    return moves
+
+
+def _white_pawn_6(occ_all, enemy_occ):
+    moves = 0xa000 & enemy_occ
+    if not occ_all & 0x4000:
+        moves |= 0x4000
+    return moves
+
+
+def _white_pawn_7(occ_all, enemy_occ):
+    moves = 0x4000 & enemy_occ
+    if not occ_all & 0x8000:
+        moves |= 0x8000
+    return moves
+
+
+def _white_pawn_8(occ_all, enemy_occ):
+    moves = 0x20000 & enemy_occ
+    if not occ_all & 0x10000:
+        moves |= 0x10000
+        if not occ_all & 0x1000000:
+            moves |= 0x1000000
+    return moves
+
+
+def _white_pawn_9(occ_all, enemy_occ):
+    moves = 0x50000 & enemy_occ
+    if not occ_all & 0x20000:
+        moves |= 0x20000
+        if not occ_all & 0x2000000:
+            moves |= 0x2000000
+    return moves
+
+
+def _white_pawn_10(occ_all, enemy_occ):
+    moves = 0xa0000 & enemy_occ
+    if not occ_all & 0x40000:
+        moves |= 0x40000
+        if not occ_all & 0x4000000:
+            moves |= 0x4000000
+    return moves
+
+
+def _white_pawn_11(occ_all, enemy_occ):
+    moves = 0x140000 & enemy_occ
+    if not occ_all & 0x80000:
+        moves |= 0x80000
+        if not occ_all & 0x8000000:
+            moves |= 0x8000000
+    return moves
+
+
+def _white_pawn_12(occ_all, enemy_occ):
+    moves = 0x280000 & enemy_occ
+    if not occ_all & 0x100000:
+        moves |= 0x100000
+        if not occ_all & 0x10000000:
+            moves |= 0x10000000
+    return moves
+
+
+def _white_pawn_13(occ_all, enemy_occ):
+    moves = 0x500000 & enemy_occ
+    if not occ_all & 0x200000:
+        moves |= 0x200000
+        if not occ_all & 0x20000000:
+            moves |= 0x20000000
+    return moves
+
+
+def _white_pawn_14(occ_all, enemy_occ):
+    moves = 0xa00000 & enemy_occ
+    if not occ_all & 0x400000:
+        moves |= 0x400000
+        if not occ_all & 0x40000000:
+            moves |= 0x40000000
+    return moves
+
+
+def _white_pawn_15(occ_all, enemy_occ):
+    moves = 0x400000 & enemy_occ
+    if not occ_all & 0x800000:
+        moves |= 0x800000
+        if not occ_all & 0x80000000:
+            moves |= 0x80000000
+    return moves
+
+
+def _white_pawn_16(occ_all, enemy_occ):
+    moves = 0x2000000 & enemy_occ
+    if not occ_all & 0x1000000:
+        moves |= 0x1000000
+    return moves
+
+
+def _white_pawn_17(occ_all, enemy_occ):
+    moves = 0x5000000 & enemy_occ
+    if not occ_all & 0x2000000:
+        moves |= 0x2000000
+    return moves
+
+
+def _white_pawn_18(occ_all, enemy_occ):
+    moves = 0xa000000 & enemy_occ
+    if not occ_all & 0x4000000:
+        moves |= 0x4000000
+    return moves
+
+
+def _white_pawn_19(occ_all, enemy_occ):
+    moves = 0x14000000 & enemy_occ
+    if not occ_all & 0x8000000:
+        moves |= 0x8000000
+    return moves
+
+
+def _white_pawn_20(occ_all, enemy_occ):
+    moves = 0x28000000 & enemy_occ
+    if not occ_all & 0x10000000:
+        moves |= 0x10000000
+    return moves
+
+
+def _white_pawn_21(occ_all, enemy_occ):
+    moves = 0x50000000 & enemy_occ
+    if not occ_all & 0x20000000:
+        moves |= 0x20000000
+    return moves
+
+
+def _white_pawn_22(occ_all, enemy_occ):
+    moves = 0xa0000000 & enemy_occ
+    if not occ_all & 0x40000000:
+        moves |= 0x40000000
+    return moves
+
+
+def _white_pawn_23(occ_all, enemy_occ):
+    moves = 0x40000000 & enemy_occ
+    if not occ_all & 0x80000000:
+        moves |= 0x80000000
+    return moves
+
+
+def _white_pawn_24(occ_all, enemy_occ):
+    moves = 0x200000000 & enemy_occ
+    if not occ_all & 0x100000000:
+        moves |= 0x100000000
+    return moves
+
+
+def _white_pawn_25(occ_all, enemy_occ):
+    moves = 0x500000000 & enemy_occ
+    if not occ_all & 0x200000000:
+        moves |= 0x200000000
+    return moves
+
+
+def _white_pawn_26(occ_all, enemy_occ):
+    moves = 0xa00000000 & enemy_occ
+    if not occ_all & 0x400000000:
+        moves |= 0x400000000
+    return moves
+
+
+def _white_pawn_27(occ_all, enemy_occ):
+    moves = 0x1400000000 & enemy_occ
+    if not occ_all & 0x800000000:
+        moves |= 0x800000000
+    return moves
+
+
+def _white_pawn_28(occ_all, enemy_occ):
+    moves = 0x2800000000 & enemy_occ
+    if not occ_all & 0x1000000000:
+        moves |= 0x1000000000
+    return moves
+
+
+def _white_pawn_29(occ_all, enemy_occ):
+    moves = 0x5000000000 & enemy_occ
+    if not occ_all & 0x2000000000:
+        moves |= 0x2000000000
+    return moves
+
+
+def _white_pawn_30(occ_all, enemy_occ):
+    moves = 0xa000000000 & enemy_occ
+    if not occ_all & 0x4000000000:
+        moves |= 0x4000000000
+    return moves
+
+
+def _white_pawn_31(occ_all, enemy_occ):
+    moves = 0x4000000000 & enemy_occ
+    if not occ_all & 0x8000000000:
+        moves |= 0x8000000000
+    return moves
+
+
+def _white_pawn_32(occ_all, enemy_occ):
+    moves = 0x20000000000 & enemy_occ
+    if not occ_all & 0x10000000000:
+        moves |= 0x10000000000
+    return moves
+
+
+def _white_pawn_33(occ_all, enemy_occ):
+    moves = 0x50000000000 & enemy_occ
+    if not occ_all & 0x20000000000:
+        moves |= 0x20000000000
+    return moves
+
+
+def _white_pawn_34(occ_all, enemy_occ):
+    moves = 0xa0000000000 & enemy_occ
+    if not occ_all & 0x40000000000:
+        moves |= 0x40000000000
+    return moves
+
+
+def _white_pawn_35(occ_all, enemy_occ):
+    moves = 0x140000000000 & enemy_occ
+    if not occ_all & 0x80000000000:
+        moves |= 0x80000000000
+    return moves
+
+
+def _white_pawn_36(occ_all, enemy_occ):
+    moves = 0x280000000000 & enemy_occ
+    if not occ_all & 0x100000000000:
+        moves |= 0x100000000000
+    return moves
+
+
+def _white_pawn_37(occ_all, enemy_occ):
+    moves = 0x500000000000 & enemy_occ
+    if not occ_all & 0x200000000000:
+        moves |= 0x200000000000
+    return moves
+
+
+def _white_pawn_38(occ_all, enemy_occ):
+    moves = 0xa00000000000 & enemy_occ
+    if not occ_all & 0x400000000000:
+        moves |= 0x400000000000
+    return moves
+
+
+def _white_pawn_39(occ_all, enemy_occ):
+    moves = 0x400000000000 & enemy_occ
+    if not occ_all & 0x800000000000:
+        moves |= 0x800000000000
+    return moves
+
+
+def _white_pawn_40(occ_all, enemy_occ):
+    moves = 0x2000000000000 & enemy_occ
+    if not occ_all & 0x1000000000000:
+        moves |= 0x1000000000000
+    return moves
+
+
+def _white_pawn_41(occ_all, enemy_occ):
+    moves = 0x5000000000000 & enemy_occ
+    if not occ_all & 0x2000000000000:
+        moves |= 0x2000000000000
+    return moves
+
+
+def _white_pawn_42(occ_all, enemy_occ):
+    moves = 0xa000000000000 & enemy_occ
+    if not occ_all & 0x4000000000000:
+        moves |= 0x4000000000000
+    return moves
+
+
+def _white_pawn_43(occ_all, enemy_occ):
+    moves = 0x14000000000000 & enemy_occ
+    if not occ_all & 0x8000000000000:
+        moves |= 0x8000000000000
+    return moves
+
+
+def _white_pawn_44(occ_all, enemy_occ):
+    moves = 0x28000000000000 & enemy_occ
+    if not occ_all & 0x10000000000000:
+        moves |= 0x10000000000000
+    return moves
+
+
+def _white_pawn_45(occ_all, enemy_occ):
+    moves = 0x50000000000000 & enemy_occ
+    if not occ_all & 0x20000000000000:
+        moves |= 0x20000000000000
+    return moves
+
+
+def _white_pawn_46(occ_all, enemy_occ):
+    moves = 0xa0000000000000 & enemy_occ
+    if not occ_all & 0x40000000000000:
+        moves |= 0x40000000000000
+    return moves
+
+
+def _white_pawn_47(occ_all, enemy_occ):
+    moves = 0x40000000000000 & enemy_occ
+    if not occ_all & 0x80000000000000:
+        moves |= 0x80000000000000
+    return moves
+
+
+def _white_pawn_48(occ_all, enemy_occ):
+    moves = 0x200000000000000 & enemy_occ
+    if not occ_all & 0x100000000000000:
+        moves |= 0x100000000000000
+    return moves
+
+
+def _white_pawn_49(occ_all, enemy_occ):
+    moves = 0x500000000000000 & enemy_occ
+    if not occ_all & 0x200000000000000:
+        moves |= 0x200000000000000
+    return moves
+
+
+def _white_pawn_50(occ_all, enemy_occ):
+    moves = 0xa00000000000000 & enemy_occ
+    if not occ_all & 0x400000000000000:
+        moves |= 0x400000000000000
+    return moves
+
+
+def _white_pawn_51(occ_all, enemy_occ):
+    moves = 0x1400000000000000 & enemy_occ
+    if not occ_all & 0x800000000000000:
+        moves |= 0x800000000000000
+    return moves
+
+
+def _white_pawn_52(occ_all, enemy_occ):
+    moves = 0x2800000000000000 & enemy_occ
+    if not occ_all & 0x1000000000000000:
+        moves |= 0x1000000000000000
+    return moves
+
+
+def _white_pawn_53(occ_all, enemy_occ):
+    moves = 0x5000000000000000 & enemy_occ
+    if not occ_all & 0x2000000000000000:
+        moves |= 0x2000000000000000
+    return moves
+
+
+def _white_pawn_54(occ_all, enemy_occ):
+    moves = 0xa000000000000000 & enemy_occ
+    if not occ_all & 0x4000000000000000:
+        moves |= 0x4000000000000000
+    return moves
+
+
+def _white_pawn_55(occ_all, enemy_occ):
+    moves = 0x4000000000000000 & enemy_occ
+    if not occ_all & 0x8000000000000000:
+        moves |= 0x8000000000000000
+    return moves
+
+
+def _white_pawn_56(occ_all, enemy_occ):
+    return 0
+
+
+def _white_pawn_57(occ_all, enemy_occ):
+    return 0
+
+
+def _white_pawn_58(occ_all, enemy_occ):
+    return 0
+
+
+def _white_pawn_59(occ_all, enemy_occ):
+    return 0
+
+
+def _white_pawn_60(occ_all, enemy_occ):
+    return 0
+
+
+def _white_pawn_61(occ_all, enemy_occ):
+    return 0
+
+
+def _white_pawn_62(occ_all, enemy_occ):
+    return 0
+
+
+def _white_pawn_63(occ_all, enemy_occ):
+    return 0
+
+
+def _black_pawn_0(occ_all, enemy_occ):
+    return 0
+
+
+def _black_pawn_1(occ_all, enemy_occ):
+    return 0
+
+
+def _black_pawn_2(occ_all, enemy_occ):
+    return 0
+
+
+def _black_pawn_3(occ_all, enemy_occ):
+    return 0
+
+
+def _black_pawn_4(occ_all, enemy_occ):
+    return 0
+
+
+def _black_pawn_5(occ_all, enemy_occ):
+    return 0
+
+
+def _black_pawn_6(occ_all, enemy_occ):
+    return 0
+
+
+def _black_pawn_7(occ_all, enemy_occ):
+    return 0
+
+
+def _black_pawn_8(occ_all, enemy_occ):
+    moves = 0x2 & enemy_occ
+    if not occ_all & 0x1:
+        moves |= 0x1
+    return moves
+
+
+def _black_pawn_9(occ_all, enemy_occ):
+    moves = 0x5 & enemy_occ
+    if not occ_all & 0x2:
+        moves |= 0x2
+    return moves
+
+
+def _black_pawn_10(occ_all, enemy_occ):
+    moves = 0xa & enemy_occ
+    if not occ_all & 0x4:
+        moves |= 0x4
+    return moves
+
+
+def _black_pawn_11(occ_all, enemy_occ):
+    moves = 0x14 & enemy_occ
+    if not occ_all & 0x8:
+        moves |= 0x8
+    return moves
+
+
+def _black_pawn_12(occ_all, enemy_occ):
+    moves = 0x28 & enemy_occ
+    if not occ_all & 0x10:
+        moves |= 0x10
+    return moves
+
+
+def _black_pawn_13(occ_all, enemy_occ):
+    moves = 0x50 & enemy_occ
+    if not occ_all & 0x20:
+        moves |= 0x20
+    return moves
+
+
+def _black_pawn_14(occ_all, enemy_occ):
+    moves = 0xa0 & enemy_occ
+    if not occ_all & 0x40:
+        moves |= 0x40
+    return moves
+
+
+def _black_pawn_15(occ_all, enemy_occ):
+    moves = 0x40 & enemy_occ
+    if not occ_all & 0x80:
+        moves |= 0x80
+    return moves
+
+
+def _black_pawn_16(occ_all, enemy_occ):
+    moves = 0x200 & enemy_occ
+    if not occ_all & 0x100:
+        moves |= 0x100
+    return moves
+
+
+def _black_pawn_17(occ_all, enemy_occ):
+    moves = 0x500 & enemy_occ
+    if not occ_all & 0x200:
+        moves |= 0x200
+    return moves
+
+
+def _black_pawn_18(occ_all, enemy_occ):
+    moves = 0xa00 & enemy_occ
+    if not occ_all & 0x400:
+        moves |= 0x400
+    return moves
+
+
+def _black_pawn_19(occ_all, enemy_occ):
+    moves = 0x1400 & enemy_occ
+    if not occ_all & 0x800:
+        moves |= 0x800
+    return moves
+
+
+def _black_pawn_20(occ_all, enemy_occ):
+    moves = 0x2800 & enemy_occ
+    if not occ_all & 0x1000:
+        moves |= 0x1000
+    return moves
+
+
+def _black_pawn_21(occ_all, enemy_occ):
+    moves = 0x5000 & enemy_occ
+    if not occ_all & 0x2000:
+        moves |= 0x2000
+    return moves
+
+
+def _black_pawn_22(occ_all, enemy_occ):
+    moves = 0xa000 & enemy_occ
+    if not occ_all & 0x4000:
+        moves |= 0x4000
+    return moves
+
+
+def _black_pawn_23(occ_all, enemy_occ):
+    moves = 0x4000 & enemy_occ
+    if not occ_all & 0x8000:
+        moves |= 0x8000
+    return moves
+
+
+def _black_pawn_24(occ_all, enemy_occ):
+    moves = 0x20000 & enemy_occ
+    if not occ_all & 0x10000:
+        moves |= 0x10000
+    return moves
+
+
+def _black_pawn_25(occ_all, enemy_occ):
+    moves = 0x50000 & enemy_occ
+    if not occ_all & 0x20000:
+        moves |= 0x20000
+    return moves
+
+
+def _black_pawn_26(occ_all, enemy_occ):
+    moves = 0xa0000 & enemy_occ
+    if not occ_all & 0x40000:
+        moves |= 0x40000
+    return moves
+
+
+def _black_pawn_27(occ_all, enemy_occ):
+    moves = 0x140000 & enemy_occ
+    if not occ_all & 0x80000:
+        moves |= 0x80000
+    return moves
+
+
+def _black_pawn_28(occ_all, enemy_occ):
+    moves = 0x280000 & enemy_occ
+    if not occ_all & 0x100000:
+        moves |= 0x100000
+    return moves
+
+
+def _black_pawn_29(occ_all, enemy_occ):
+    moves = 0x500000 & enemy_occ
+    if not occ_all & 0x200000:
+        moves |= 0x200000
+    return moves
+
+
+def _black_pawn_30(occ_all, enemy_occ):
+    moves = 0xa00000 & enemy_occ
+    if not occ_all & 0x400000:
+        moves |= 0x400000
+    return moves
+
+
+def _black_pawn_31(occ_all, enemy_occ):
+    moves = 0x400000 & enemy_occ
+    if not occ_all & 0x800000:
+        moves |= 0x800000
+    return moves
+
+
+def _black_pawn_32(occ_all, enemy_occ):
+    moves = 0x2000000 & enemy_occ
+    if not occ_all & 0x1000000:
+        moves |= 0x1000000
+    return moves
+
+
+def _black_pawn_33(occ_all, enemy_occ):
+    moves = 0x5000000 & enemy_occ
+    if not occ_all & 0x2000000:
+        moves |= 0x2000000
+    return moves
+
+
+def _black_pawn_34(occ_all, enemy_occ):
+    moves = 0xa000000 & enemy_occ
+    if not occ_all & 0x4000000:
+        moves |= 0x4000000
+    return moves
+
+
+def _black_pawn_35(occ_all, enemy_occ):
+    moves = 0x14000000 & enemy_occ
+    if not occ_all & 0x8000000:
+        moves |= 0x8000000
+    return moves
+
+
+def _black_pawn_36(occ_all, enemy_occ):
+    moves = 0x28000000 & enemy_occ
+    if not occ_all & 0x10000000:
+        moves |= 0x10000000
+    return moves
+
+
+def _black_pawn_37(occ_all, enemy_occ):
+    moves = 0x50000000 & enemy_occ
+    if not occ_all & 0x20000000:
+        moves |= 0x20000000
+    return moves
+
+
+def _black_pawn_38(occ_all, enemy_occ):
+    moves = 0xa0000000 & enemy_occ
+    if not occ_all & 0x40000000:
+        moves |= 0x40000000
+    return moves
+
+
+def _black_pawn_39(occ_all, enemy_occ):
+    moves = 0x40000000 & enemy_occ
+    if not occ_all & 0x80000000:
+        moves |= 0x80000000
+    return moves
+
+
+def _black_pawn_40(occ_all, enemy_occ):
+    moves = 0x200000000 & enemy_occ
+    if not occ_all & 0x100000000:
+        moves |= 0x100000000
+    return moves
+
+
+def _black_pawn_41(occ_all, enemy_occ):
+    moves = 0x500000000 & enemy_occ
+    if not occ_all & 0x200000000:
+        moves |= 0x200000000
+    return moves
+
+
+def _black_pawn_42(occ_all, enemy_occ):
+    moves = 0xa00000000 & enemy_occ
+    if not occ_all & 0x400000000:
+        moves |= 0x400000000
+    return moves
+
+
+def _black_pawn_43(occ_all, enemy_occ):
+    moves = 0x1400000000 & enemy_occ
+    if not occ_all & 0x800000000:
+        moves |= 0x800000000
+    return moves
+
+
+def _black_pawn_44(occ_all, enemy_occ):
+    moves = 0x2800000000 & enemy_occ
+    if not occ_all & 0x1000000000:
+        moves |= 0x1000000000
+    return moves
+
+
+def _black_pawn_45(occ_all, enemy_occ):
+    moves = 0x5000000000 & enemy_occ
+    if not occ_all & 0x2000000000:
+        moves |= 0x2000000000
+    return moves
+
+
+def _black_pawn_46(occ_all, enemy_occ):
+    moves = 0xa000000000 & enemy_occ
+    if not occ_all & 0x4000000000:
+        moves |= 0x4000000000
+    return moves
+
+
+def _black_pawn_47(occ_all, enemy_occ):
+    moves = 0x4000000000 & enemy_occ
+    if not occ_all & 0x8000000000:
+        moves |= 0x8000000000
+    return moves
+
+
+def _black_pawn_48(occ_all, enemy_occ):
+    moves = 0x20000000000 & enemy_occ
+    if not occ_all & 0x10000000000:
+        moves |= 0x10000000000
+        if not occ_all & 0x100000000:
+            moves |= 0x100000000
+    return moves
+
+
+def _black_pawn_49(occ_all, enemy_occ):
+    moves = 0x50000000000 & enemy_occ
+    if not occ_all & 0x20000000000:
+        moves |= 0x20000000000
+        if not occ_all & 0x200000000:
+            moves |= 0x200000000
+    return moves
+
+
+def _black_pawn_50(occ_all, enemy_occ):
+    moves = 0xa0000000000 & enemy_occ
+    if not occ_all & 0x40000000000:
+        moves |= 0x40000000000
+        if not occ_all & 0x400000000:
+            moves |= 0x400000000
+    return moves
+
+
+def _black_pawn_51(occ_all, enemy_occ):
+    moves = 0x140000000000 & enemy_occ
+    if not occ_all & 0x80000000000:
+        moves |= 0x80000000000
+        if not occ_all & 0x800000000:
+            moves |= 0x800000000
+    return moves
+
+
+def _black_pawn_52(occ_all, enemy_occ):
+    moves = 0x280000000000 & enemy_occ
+    if not occ_all & 0x100000000000:
+        moves |= 0x100000000000
+        if not occ_all & 0x1000000000:
+            moves |= 0x1000000000
+    return moves
+
+
+def _black_pawn_53(occ_all, enemy_occ):
+    moves = 0x500000000000 & enemy_occ
+    if not occ_all & 0x200000000000:
+        moves |= 0x200000000000
+        if not occ_all & 0x2000000000:
+            moves |= 0x2000000000
+    return moves
+
+
+def _black_pawn_54(occ_all, enemy_occ):
+    moves = 0xa00000000000 & enemy_occ
+    if not occ_all & 0x400000000000:
+        moves |= 0x400000000000
+        if not occ_all & 0x4000000000:
+            moves |= 0x4000000000
+    return moves
+
+
+def _black_pawn_55(occ_all, enemy_occ):
+    moves = 0x400000000000 & enemy_occ
+    if not occ_all & 0x800000000000:
+        moves |= 0x800000000000
+        if not occ_all & 0x8000000000:
+            moves |= 0x8000000000
+    return moves
+
+
+def _black_pawn_56(occ_all, enemy_occ):
+    moves = 0x2000000000000 & enemy_occ
+    if not occ_all & 0x1000000000000:
+        moves |= 0x1000000000000
+    return moves
+
+
+def _black_pawn_57(occ_all, enemy_occ):
+    moves = 0x5000000000000 & enemy_occ
+    if not occ_all & 0x2000000000000:
+        moves |= 0x2000000000000
+    return moves
+
+
+def _black_pawn_58(occ_all, enemy_occ):
+    moves = 0xa000000000000 & enemy_occ
+    if not occ_all & 0x4000000000000:
+        moves |= 0x4000000000000
+    return moves
+
+
+def _black_pawn_59(occ_all, enemy_occ):
+    moves = 0x14000000000000 & enemy_occ
+    if not occ_all & 0x8000000000000:
+        moves |= 0x8000000000000
+    return moves
+
+
+def _black_pawn_60(occ_all, enemy_occ):
+    moves = 0x28000000000000 & enemy_occ
+    if not occ_all & 0x10000000000000:
+        moves |= 0x10000000000000
+    return moves
+
+
+def _black_pawn_61(occ_all, enemy_occ):
+    moves = 0x50000000000000 & enemy_occ
+    if not occ_all & 0x20000000000000:
+        moves |= 0x20000000000000
+    return moves
+
+
+def _black_pawn_62(occ_all, enemy_occ):
+    moves = 0xa0000000000000 & enemy_occ
+    if not occ_all & 0x40000000000000:
+        moves |= 0x40000000000000
+    return moves
+
+
+def _black_pawn_63(occ_all, enemy_occ):
+    moves = 0x40000000000000 & enemy_occ
+    if not occ_all & 0x80000000000000:
+        moves |= 0x80000000000000
+    return moves
+
+
+WHITE_PAWN_MOVES = (
+    _white_pawn_0,
+    _white_pawn_1,
+    _white_pawn_2,
+    _white_pawn_3,
+    _white_pawn_4,
+    _white_pawn_5,
+    _white_pawn_6,
+    _white_pawn_7,
+    _white_pawn_8,
+    _white_pawn_9,
+    _white_pawn_10,
+    _white_pawn_11,
+    _white_pawn_12,
+    _white_pawn_13,
+    _white_pawn_14,
+    _white_pawn_15,
+    _white_pawn_16,
+    _white_pawn_17,
+    _white_pawn_18,
+    _white_pawn_19,
+    _white_pawn_20,
+    _white_pawn_21,
+    _white_pawn_22,
+    _white_pawn_23,
+    _white_pawn_24,
+    _white_pawn_25,
+    _white_pawn_26,
+    _white_pawn_27,
+    _white_pawn_28,
+    _white_pawn_29,
+    _white_pawn_30,
+    _white_pawn_31,
+    _white_pawn_32,
+    _white_pawn_33,
+    _white_pawn_34,
+    _white_pawn_35,
+    _white_pawn_36,
+    _white_pawn_37,
+    _white_pawn_38,
+    _white_pawn_39,
+    _white_pawn_40,
+    _white_pawn_41,
+    _white_pawn_42,
+    _white_pawn_43,
+    _white_pawn_44,
+    _white_pawn_45,
+    _white_pawn_46,
+    _white_pawn_47,
+    _white_pawn_48,
+    _white_pawn_49,
+    _white_pawn_50,
+    _white_pawn_51,
+    _white_pawn_52,
+    _white_pawn_53,
+    _white_pawn_54,
+    _white_pawn_55,
+    _white_pawn_56,
+    _white_pawn_57,
+    _white_pawn_58,
+    _white_pawn_59,
+    _white_pawn_60,
+    _white_pawn_61,
+    _white_pawn_62,
+    _white_pawn_63,
+)
+
+
+BLACK_PAWN_MOVES = (
+    _black_pawn_0,
+    _black_pawn_1,
+    _black_pawn_2,
+    _black_pawn_3,
+    _black_pawn_4,
+    _black_pawn_5,
+    _black_pawn_6,
+    _black_pawn_7,
+    _black_pawn_8,
+    _black_pawn_9,
+    _black_pawn_10,
+    _black_pawn_11,
+    _black_pawn_12,
+    _black_pawn_13,
+    _black_pawn_14,
+    _black_pawn_15,
+    _black_pawn_16,
+    _black_pawn_17,
+    _black_pawn_18,
+    _black_pawn_19,
+    _black_pawn_20,
+    _black_pawn_21,
+    _black_pawn_22,
+    _black_pawn_23,
+    _black_pawn_24,
+    _black_pawn_25,
+    _black_pawn_26,
+    _black_pawn_27,
+    _black_pawn_28,
+    _black_pawn_29,
+    _black_pawn_30,
+    _black_pawn_31,
+    _black_pawn_32,
+    _black_pawn_33,
+    _black_pawn_34,
+    _black_pawn_35,
+    _black_pawn_36,
+    _black_pawn_37,
+    _black_pawn_38,
+    _black_pawn_39,
+    _black_pawn_40,
+    _black_pawn_41,
+    _black_pawn_42,
+    _black_pawn_43,
+    _black_pawn_44,
+    _black_pawn_45,
+    _black_pawn_46,
+    _black_pawn_47,
+    _black_pawn_48,
+    _black_pawn_49,
+    _black_pawn_50,
+    _black_pawn_51,
+    _black_pawn_52,
+    _black_pawn_53,
+    _black_pawn_54,
+    _black_pawn_55,
+    _black_pawn_56,
+    _black_pawn_57,
+    _black_pawn_58,
+    _black_pawn_59,
+    _black_pawn_60,
+    _black_pawn_61,
+    _black_pawn_62,
+    _black_pawn_63,
+)
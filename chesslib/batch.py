@@ -0,0 +1,80 @@
+"""
+    NumPy-batched bitboard operations.
+
+    A "frontier" is an (N, 12) uint64 ndarray - N positions, one row of
+    the 12 piece bitboards each (same layout as Board.bb).  All attack
+    sets here are computed with whole-array shift/mask expressions, so
+    NumPy runs one vectorized loop over the batch instead of Python
+    iterating positions one by one.  Worth it from roughly N >= 8.
+
+    Optional module: only it imports numpy, the game itself never does.
+"""
+import numpy as np
+
+U64 = np.uint64
+
+_FILE_A = U64(0x0101010101010101)
+_FILE_H = U64(0x8080808080808080)
+NOT_FILE_A = ~_FILE_A
+NOT_FILE_H = ~_FILE_H
+NOT_FILE_AB = ~(_FILE_A | U64(0x0202020202020202))
+NOT_FILE_GH = ~(_FILE_H | U64(0x4040404040404040))
+
+_1, _2, _7, _8, _9, _16 = (U64(n) for n in (1, 2, 7, 8, 9, 16))
+
+
+def pack(boards):
+    """
+        Stack the bitboards of an iterable of Board objects into a
+        frontier array
+    """
+    return np.array([b.bb for b in boards], dtype=np.uint64)
+
+
+def occupancy(frontier):
+    """
+        Return (occ_white, occ_black, occ_all) arrays for a frontier
+    """
+    occ_white = np.bitwise_or.reduce(frontier[:, :6], axis=1)
+    occ_black = np.bitwise_or.reduce(frontier[:, 6:], axis=1)
+    return occ_white, occ_black, occ_white | occ_black
+
+
+def knight_attacks(knights):
+    """
+        Attack sets for all knights of every position at once
+    """
+    l1 = (knights >> _1) & NOT_FILE_H
+    l2 = (knights >> _2) & NOT_FILE_GH
+    r1 = (knights << _1) & NOT_FILE_A
+    r2 = (knights << _2) & NOT_FILE_AB
+    h1 = l1 | r1
+    h2 = l2 | r2
+    return (h1 << _16) | (h1 >> _16) | (h2 << _8) | (h2 >> _8)
+
+
+def king_attacks(kings):
+    attacks = ((kings << _1) & NOT_FILE_A) | ((kings >> _1) & NOT_FILE_H)
+    full = attacks | kings
+    return attacks | (full << _8) | (full >> _8)
+
+
+def pawn_attacks(pawns, white):
+    if white:
+        return ((pawns << _9) & NOT_FILE_A) | ((pawns << _7) & NOT_FILE_H)
+    return ((pawns >> _7) & NOT_FILE_A) | ((pawns >> _9) & NOT_FILE_H)
+
+
+def leaper_attack_sets(frontier, color):
+    """
+        Per-position attack bitboards of `color`'s pawns, knights and
+        king, already masked by the side's own occupancy
+    """
+    white = color == 'white'
+    offset = 0 if white else 6
+    occ_white, occ_black, _ = occupancy(frontier)
+    own = occ_white if white else occ_black
+    attacks = (pawn_attacks(frontier[:, offset], white) |
+               knight_attacks(frontier[:, offset + 1]) |
+               king_attacks(frontier[:, offset + 5]))
+    return attacks & ~own
@@ -1,14 +1,15 @@
 from itertools import groupby
-from copy import deepcopy
 
-import pieces
-import re
+import random
 
-##########
-# import time
-from multiprocessing import Pool
-import pathos.pools as pp
-###########
+from chesslib import pieces
+from chesslib._movegen_generated import WHITE_PAWN_MOVES, BLACK_PAWN_MOVES
+
+try:
+    # Optional C kernels; build with `python setup.py build_ext --inplace`
+    from chesslib import _movegen as _movegen_ext
+except ImportError:
+    _movegen_ext = None
 
 
 class ChessError(Exception):
@@ -43,15 +44,206 @@ class NotYourTurn(ChessError):
     pass
 
 FEN_STARTING = 'rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1'
-RANK_REGEX = re.compile(r"^[A-Z][1-8]$")
+
+# FEN digit -> run of blanks, so placement rows expand with one dict
+# lookup per character instead of a regex callback per digit
+FEN_EXPAND = dict((str(i), ' ' * i) for i in range(1, 9))
+
+# Square indexes run A1=0 .. H8=63 (rank-major, matching number_notation)
+SQ_TO_STR = tuple(letter + str(number)
+                  for number in range(1, 9)
+                  for letter in 'ABCDEFGH')
+# Both cases are precomputed so lookups never need .upper()
+STR_TO_SQ = {}
+for _sq, _coord in enumerate(SQ_TO_STR):
+    STR_TO_SQ[_coord] = _sq
+    STR_TO_SQ[_coord.lower()] = _sq
+
+# One bitboard per piece type and color, indexed by FEN abbreviation
+PIECE_INDEX = {'P': 0, 'N': 1, 'B': 2, 'R': 3, 'Q': 4, 'K': 5,
+               'p': 6, 'n': 7, 'b': 8, 'r': 9, 'q': 10, 'k': 11}
+
+
+# Material values indexed like PIECE_INDEX (white positive, black negative)
+PIECE_VALUES = (100, 320, 330, 500, 900, 0,
+                -100, -320, -330, -500, -900, 0)
+
+# MVV-LVA piece weights by piece type (king last as attacker)
+MVV_LVA_VALUES = (1, 3, 3, 5, 9, 20)
+
+DOUBLED_PAWN_PENALTY = 20
+ISOLATED_PAWN_PENALTY = 10
+
+FILE_MASKS = tuple(0x0101010101010101 << f for f in range(8))
+ADJACENT_FILE_MASKS = tuple(
+    (FILE_MASKS[f - 1] if f > 0 else 0) | (FILE_MASKS[f + 1] if f < 7 else 0)
+    for f in range(8))
+
+# Pawn-structure and full-evaluation caches are cleared once they reach
+# this many entries
+CACHE_SIZE = 1 << 16
+
+INFINITY = 10 ** 6
+MATE_VALUE = 10 ** 5
+
+# Zobrist keys: one random 64-bit number per (piece, square), plus one
+# for the side to move.  Fixed seed keeps keys reproducible across runs.
+_zobrist_rng = random.Random(0x5EED)
+ZOBRIST_PIECE = tuple(tuple(_zobrist_rng.getrandbits(64) for _ in range(64))
+                      for _ in range(12))
+ZOBRIST_TURN = _zobrist_rng.getrandbits(64)
+
+# Transposition table entry flags
+TT_EXACT, TT_LOWER, TT_UPPER = 0, 1, 2
+
+
+def encode_move(from_sq, to_sq, piece_type, capture):
+    """
+        Pack a move into 16 bits:
+        from(6) | to(6) | piece type(3) | capture flag(1)
+    """
+    return (from_sq << 10) | (to_sq << 4) | (piece_type << 1) | capture
+
+
+def move_to_san(move):
+    """
+        Render a packed move the way the old history strings looked,
+        e.g. "e4", "Nf3" or "Qxh4"
+    """
+    to_sq = (move >> 4) & 0x3F
+    piece_type = (move >> 1) & 0x7
+    capture = move & 1
+    abbr = '' if piece_type == 0 else 'PNBRQK'[piece_type]
+    return abbr + ('x' if capture else '') + SQ_TO_STR[to_sq].lower()
+
+
+try:
+    int.bit_count
+except AttributeError:
+    # Pre-3.10 fallback
+    def popcount(bb):
+        return bin(bb).count('1')
+else:
+    # Python >= 3.10: dispatches to the hardware POPCNT
+    def popcount(bb):
+        return bb.bit_count()
+
+
+def lsb(bb):
+    """
+        Index of the lowest set bit
+    """
+    return (bb & -bb).bit_length() - 1
+
+
+def iter_bits(bb):
+    """
+        Yield the square index of every set bit, lowest first
+    """
+    while bb:
+        bit = bb & -bb
+        yield bit.bit_length() - 1
+        bb ^= bit
+
+
+def _leaper_attacks(deltas):
+    """
+        Build a 64-entry attack table for a piece that jumps by `deltas`
+    """
+    table = []
+    for sq in range(64):
+        row, col = divmod(sq, 8)
+        bb = 0
+        for dr, dc in deltas:
+            r, c = row + dr, col + dc
+            if 0 <= r <= 7 and 0 <= c <= 7:
+                bb |= 1 << (r * 8 + c)
+        table.append(bb)
+    return tuple(table)
+
+KNIGHT_ATTACKS = _leaper_attacks(((-2, -1), (-2, 1), (-1, -2), (-1, 2),
+                                  (1, -2), (1, 2), (2, -1), (2, 1)))
+KING_ATTACKS = _leaper_attacks(((-1, -1), (-1, 0), (-1, 1), (0, -1),
+                                (0, 1), (1, -1), (1, 0), (1, 1)))
+PAWN_ATTACKS = {'white': _leaper_attacks(((1, -1), (1, 1))),
+                'black': _leaper_attacks(((-1, -1), (-1, 1)))}
+
+# Ray tables for the sliders: directions 0-3 run towards higher square
+# indexes (first blocker = lowest set bit), 4-7 towards lower ones
+# (first blocker = highest set bit).
+_RAY_DELTAS = ((1, 0), (0, 1), (1, 1), (1, -1),
+               (-1, 0), (0, -1), (-1, -1), (-1, 1))
+RAYS = []
+for _dr, _dc in _RAY_DELTAS:
+    _table = []
+    for _sq in range(64):
+        _row, _col = divmod(_sq, 8)
+        _bb = 0
+        _r, _c = _row + _dr, _col + _dc
+        while 0 <= _r <= 7 and 0 <= _c <= 7:
+            _bb |= 1 << (_r * 8 + _c)
+            _r += _dr
+            _c += _dc
+        _table.append(_bb)
+    RAYS.append(tuple(_table))
+RAYS = tuple(RAYS)
+
+ROOK_DIRS = (0, 1, 4, 5)
+BISHOP_DIRS = (2, 3, 6, 7)
+
+
+def sliding_attacks(sq, occ, dirs):
+    """
+        Attack bitboard for a slider on `sq` given the occupancy `occ`,
+        found by cutting each precomputed ray at its first blocker
+    """
+    attacks = 0
+    for d in dirs:
+        ray = RAYS[d][sq]
+        blockers = ray & occ
+        if blockers:
+            if d < 4:
+                first = lsb(blockers)
+            else:
+                first = blockers.bit_length() - 1
+            ray ^= RAYS[d][first]
+        attacks |= ray
+    return attacks
+
+
+def rook_attacks(sq, occ):
+    return sliding_attacks(sq, occ, ROOK_DIRS)
+
+
+def bishop_attacks(sq, occ):
+    return sliding_attacks(sq, occ, BISHOP_DIRS)
+
+
+def queen_attacks(sq, occ):
+    return sliding_attacks(sq, occ, ROOK_DIRS) | \
+        sliding_attacks(sq, occ, BISHOP_DIRS)
+
+
+if _movegen_ext is not None:
+    # Hand the tables to the C extension and let its kernels replace
+    # the pure-Python ones (rook/bishop/queen_attacks pick up the
+    # rebinding through the module global)
+    _movegen_ext.init(RAYS, KNIGHT_ATTACKS, KING_ATTACKS,
+                      PAWN_ATTACKS['white'], PAWN_ATTACKS['black'])
+    sliding_attacks = _movegen_ext.sliding_attacks
 
 
-class Board(dict):
+class Board(object):
     """
        Board
 
        A simple chessboard class
 
+       Piece placement is stored as 12 bitboards (one 64-bit integer per
+       piece type and color) plus white/black/all occupancy bitboards.
+       A parallel 64-entry square list keeps the piece objects so the
+       GUIs can keep addressing squares by string coordinates ("E4").
+
        TODO:
 
         * PGN export
@@ -61,45 +253,165 @@ class Board(dict):
         * Fifty-move rule
     """
 
+    __slots__ = ('bb', 'occ_white', 'occ_black', 'occ_all', '_sq',
+                 'king_sq', 'captured_pieces', 'player_turn', 'castling',
+                 'en_passant', 'halfmove_clock', 'fullmove_number',
+                 'history', 'in_check', 'in_mate', 'transposition_table',
+                 'pawn_cache', 'eval_cache', 'zobrist', 'pawn_key')
+
     axis_y = ('A', 'B', 'C', 'D', 'E', 'F', 'G', 'H')
     axis_x = tuple(range(1, 9))  # (1,2,3,...8)
 
-    captured_pieces = {'white': [], 'black': []}
-    player_turn = None
-    castling = '-'
-    en_passant = '-'
-    halfmove_clock = 0
-    fullmove_number = 1
-    history = []
-
-    in_check = ("", False)
-    in_mate = ("", False)
-
     def __init__(self, fen=None):
+        # All mutable state is per instance - as class attributes these
+        # used to be silently shared by every Board ever created
+        self.captured_pieces = {'white': [], 'black': []}
+        self.history = []
+        self.in_check = ("", False)
+        self.in_mate = ("", False)
+        self.player_turn = None
+        self.castling = '-'
+        self.en_passant = '-'
+        self.halfmove_clock = 0
+        self.fullmove_number = 1
+        self.transposition_table = {}
+        self.pawn_cache = {}
+        self.eval_cache = {}
         if fen is None:
             self.load(FEN_STARTING)
         else:
             self.load(fen)
 
     def __getitem__(self, coord):
-        if isinstance(coord, str):
-            coord = coord.upper()
-            if not re.match(RANK_REGEX, coord.upper()):
-                raise KeyError
-        elif isinstance(coord, tuple):
+        if type(coord) is int:
+            return self._sq[coord]
+        if type(coord) is tuple:
             coord = self.letter_notation(coord)
+            if coord is None:
+                return None
+        sq = STR_TO_SQ.get(coord)
+        if sq is None:
+            raise KeyError(coord)
+        return self._sq[sq]
+
+    def __setitem__(self, coord, piece):
+        self._put(STR_TO_SQ[coord], piece)
+
+    def __delitem__(self, coord):
+        self._remove(STR_TO_SQ[coord])
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def get(self, coord, default=None):
         try:
-            return super(Board, self).__getitem__(coord)
+            return self[coord]
         except KeyError:
+            return default
+
+    def keys(self):
+        """
+            Return a list of occupied coordinates
+        """
+        return [SQ_TO_STR[sq] for sq in iter_bits(self.occ_all)]
+
+    def items(self):
+        for sq in iter_bits(self.occ_all):
+            yield SQ_TO_STR[sq], self._sq[sq]
+
+    def clear(self):
+        self.bb = [0] * 12
+        self.occ_white = 0
+        self.occ_black = 0
+        self.occ_all = 0
+        self._sq = [None] * 64
+        self.king_sq = {'white': None, 'black': None}
+        self.zobrist = 0
+        self.pawn_key = 0
+
+    def _put(self, sq, piece):
+        """
+            Place a piece on a square index, updating the bitboards
+        """
+        if self._sq[sq] is not None:
+            self._remove(sq)
+        self._sq[sq] = piece
+        bit = 1 << sq
+        index = PIECE_INDEX[piece.abbreviation]
+        self.bb[index] |= bit
+        key = ZOBRIST_PIECE[index][sq]
+        self.zobrist ^= key
+        piece_type = index % 6
+        if piece_type == 0:
+            self.pawn_key ^= key
+        elif piece_type == 5:
+            self.king_sq[piece.color] = sq
+        if piece.color == 'white':
+            self.occ_white |= bit
+        else:
+            self.occ_black |= bit
+        self.occ_all |= bit
+
+    def _remove(self, sq):
+        """
+            Clear a square index, updating the bitboards
+        """
+        piece = self._sq[sq]
+        if piece is None:
             return None
+        self._sq[sq] = None
+        bit = 1 << sq
+        index = PIECE_INDEX[piece.abbreviation]
+        self.bb[index] ^= bit
+        key = ZOBRIST_PIECE[index][sq]
+        self.zobrist ^= key
+        piece_type = index % 6
+        if piece_type == 0:
+            self.pawn_key ^= key
+        elif piece_type == 5:
+            self.king_sq[piece.color] = None
+        if piece.color == 'white':
+            self.occ_white ^= bit
+        else:
+            self.occ_black ^= bit
+        self.occ_all ^= bit
+        return piece
 
     def save_to_file(self): pass
 
+    def _make(self, p1, p2):
+        """
+            Apply a move in place and return the undo information
+        """
+        from_sq = STR_TO_SQ[p1]
+        to_sq = STR_TO_SQ[p2]
+        piece = self._remove(from_sq)
+        captured = self._remove(to_sq)
+        self._put(to_sq, piece)
+        return (piece, captured, from_sq, to_sq,
+                self.castling, self.en_passant, self.halfmove_clock)
+
+    def _unmake(self, undo):
+        """
+            Revert a move applied by _make
+        """
+        piece, captured, from_sq, to_sq, castling, en_passant, halfmove = undo
+        self._remove(to_sq)
+        if captured is not None:
+            self._put(to_sq, captured)
+        self._put(from_sq, piece)
+        self.castling = castling
+        self.en_passant = en_passant
+        self.halfmove_clock = halfmove
+
     def is_in_check_after_move(self, p1, p2):
-        # Create a temporary board
-        tmp = deepcopy(self)
-        tmp._do_move(p1, p2)
-        return tmp.is_in_check(self[p1].color)
+        # Apply the move in place, test for check, then undo it -
+        # no board copy needed
+        color = self[p1].color
+        undo = self._make(p1, p2)
+        in_check = self.is_in_check(color)
+        self._unmake(undo)
+        return in_check
 
     def move(self, p1, p2):
         p1, p2 = p1.upper(), p2.upper()
@@ -116,7 +428,7 @@ class Board(dict):
             raise InvalidMove
 
         self._do_move(p1, p2)
-        self._finish_move(piece, dest, p2)
+        self._finish_move(piece, dest, p1, p2)
         if self.is_in_check(enemy):
             self.in_check = (enemy, True)
         else:
@@ -137,7 +449,7 @@ class Board(dict):
         del self[p1]
         self[p2] = piece
 
-    def _finish_move(self, piece, dest, p2):
+    def _finish_move(self, piece, dest, p1, p2):
         """
             Set next player turn, count moves, log moves, etc.
         """
@@ -146,22 +458,17 @@ class Board(dict):
             self.fullmove_number += 1
         self.halfmove_clock += 1
         self.player_turn = enemy
-        abbr = piece.abbreviation
-        if abbr == 'P':
-            # Pawn has no letter
-            abbr = ''
+        piece_type = PIECE_INDEX[piece.abbreviation] % 6
+        if piece_type == 0:
             # Pawn resets halfmove_clock
             self.halfmove_clock = 0
-        if dest is None:
-            # No capturing
-            movetext = abbr + p2.lower()
-        else:
-            # Capturing
-            movetext = abbr + 'x' + p2.lower()
+        if dest is not None:
             # Capturing resets halfmove_clock
             self.halfmove_clock = 0
 
-        self.history.append(movetext)
+        # History keeps packed integer moves; use move_to_san to render
+        self.history.append(encode_move(STR_TO_SQ[p1], STR_TO_SQ[p2],
+                                        piece_type, dest is not None))
 
     def all_possible_moves(self, color):
         """
@@ -171,81 +478,271 @@ class Board(dict):
         # start = time.time()
         if color not in ("black", "white"):
             raise InvalidColor
-        result = []
-        for coord in self.keys():
-            if (self[coord] is not None) and self[coord].color == color:
-                moves = self[coord].possible_moves(coord)
-                if moves:
-                    result += moves
+        result = [SQ_TO_STR[to_sq] for _, to_sq in self._gen_moves(color)]
         # print "all_possible_moves took ", time.time() - start, 's'
         return result
 
+    def _pseudo_moves_bb(self, sq):
+        """
+            Bitboard of the destinations the piece on square index `sq`
+            can (pseudo-legally) move to, straight from the attack tables
+        """
+        piece = self._sq[sq]
+        if piece.color == 'white':
+            own, enemy_occ = self.occ_white, self.occ_black
+        else:
+            own, enemy_occ = self.occ_black, self.occ_white
+
+        abbr = piece.abbreviation.upper()
+        if abbr == 'N':
+            return KNIGHT_ATTACKS[sq] & ~own
+        if abbr == 'K':
+            return KING_ATTACKS[sq] & ~own
+        if abbr == 'R':
+            return sliding_attacks(sq, self.occ_all, ROOK_DIRS) & ~own
+        if abbr == 'B':
+            return sliding_attacks(sq, self.occ_all, BISHOP_DIRS) & ~own
+        if abbr == 'Q':
+            return queen_attacks(sq, self.occ_all) & ~own
+
+        # Pawn: specialized per-square function with the masks folded in
+        if piece.color == 'white':
+            return WHITE_PAWN_MOVES[sq](self.occ_all, enemy_occ)
+        return BLACK_PAWN_MOVES[sq](self.occ_all, enemy_occ)
+
+    def pseudo_moves(self, coord):
+        """
+            Return a list of destination coordinates for the piece
+            on `coord`.  Does not check for check.
+        """
+        moves = self._pseudo_moves_bb(STR_TO_SQ[coord])
+        return [SQ_TO_STR[dest] for dest in iter_bits(moves)]
+
     def all_legal_piece_moves(self, piece):
         """
             Return a list of a piece's legal moves
         """
-        def add_move(move):
-            if self.is_in_check_after_move(piece, move) is False:
-                return move
-
-        possible_piece_moves = self[piece].possible_moves(piece)
-
-        pool = pp.ProcessPool()  # starts process workers
-        result = pool.map(add_move, possible_piece_moves)
-        return result
+        return [move for move in self.pseudo_moves(piece)
+                if not self.is_in_check_after_move(piece, move)]
 
     def all_legal_side_moves(self, color):
         """
             Return a dict of `color`'s legal moves
             In the format of PIECE: ALL LEGAL MOVES
         """
-        def add_move():
-            if (self[coord] is not None) and self[coord].color == color:
-                legal_moves = self.all_legal_piece_moves(coord)
-                if legal_moves:
-                    result[coord] = legal_moves
-
         if color not in ("black", "white"):
             raise InvalidColor
         result = {}
-        pool = Pool()  # start worker processes
-        # run this statement for all coord in self.keys()
-        [pool.apply_async(add_move, ()) for coord in self.keys()]
+        for coord in self.occupied(color):
+            legal_moves = self.all_legal_piece_moves(coord)
+            if legal_moves:
+                result[coord] = legal_moves
         return result
 
     def occupied(self, color):
         """
             Return a list of coordinates occupied by `color`
         """
-        result = []
         if color not in ("black", "white"):
             raise InvalidColor
 
-        for coord in self:
-            if self[coord].color == color:
-                result.append(coord)
-        return result
+        bb = self.occ_white if color == 'white' else self.occ_black
+        return [SQ_TO_STR[sq] for sq in iter_bits(bb)]
 
     @staticmethod
     def is_king(piece):
         return isinstance(piece, pieces.King)
 
     def get_king_position(self, color):
-        for pos in self.keys():
-            if self.is_king(self[pos]) and self[pos].color == color:
-                return pos
+        sq = self.king_sq[color]
+        if sq is not None:
+            return SQ_TO_STR[sq]
 
     def get_king(self, color):
         if color not in ("black", "white"):
             raise InvalidColor
         return self[self.get_king_position(color)]
 
+    def square_attacked(self, sq, by_color):
+        """
+            Return True as soon as any `by_color` piece attacks square
+            index `sq`.  Uses the symmetry of the attack tables: a piece
+            on X attacks `sq` exactly when the same piece on `sq` would
+            attack X.
+        """
+        if _movegen_ext is not None:
+            return _movegen_ext.square_attacked(sq, by_color == 'white',
+                                                self.bb, self.occ_all)
+        bb = self.bb
+        if by_color == 'white':
+            offset = 0
+            if PAWN_ATTACKS['black'][sq] & bb[PIECE_INDEX['P']]:
+                return True
+        else:
+            offset = 6
+            if PAWN_ATTACKS['white'][sq] & bb[PIECE_INDEX['p']]:
+                return True
+        if KNIGHT_ATTACKS[sq] & bb[offset + 1]:
+            return True
+        if KING_ATTACKS[sq] & bb[offset + 5]:
+            return True
+        occ = self.occ_all
+        if sliding_attacks(sq, occ, ROOK_DIRS) & (bb[offset + 3] | bb[offset + 4]):
+            return True
+        if sliding_attacks(sq, occ, BISHOP_DIRS) & (bb[offset + 2] | bb[offset + 4]):
+            return True
+        return False
+
     def is_in_check(self, color):
         if color not in ("black", "white"):
             raise InvalidColor
-        king = self.get_king(color)
-        enemy = self.get_enemy(color)
-        return king in map(self.__getitem__, self.all_possible_moves(enemy))
+        king_sq = self.king_sq[color]
+        if king_sq is None:
+            return False
+        return self.square_attacked(king_sq, self.get_enemy(color))
+
+    def position_key(self):
+        """
+            Zobrist key of the current position including the side to
+            move.  The piece part is maintained incrementally by
+            _put/_remove, so this is just an XOR away.
+        """
+        if self.player_turn == 'white':
+            return self.zobrist ^ ZOBRIST_TURN
+        return self.zobrist
+
+    def _pawn_structure_score(self):
+        """
+            Doubled/isolated pawn penalties, positive for white
+        """
+        score = 0
+        for index, sign in ((PIECE_INDEX['P'], 1), (PIECE_INDEX['p'], -1)):
+            pawns = self.bb[index]
+            for f in range(8):
+                on_file = popcount(pawns & FILE_MASKS[f])
+                if not on_file:
+                    continue
+                if on_file > 1:
+                    score -= sign * DOUBLED_PAWN_PENALTY * (on_file - 1)
+                if not pawns & ADJACENT_FILE_MASKS[f]:
+                    score -= sign * ISOLATED_PAWN_PENALTY * on_file
+        return score
+
+    def _evaluate(self):
+        """
+            Static evaluation (material plus pawn structure) from the
+            side to move's point of view.  The pawn-structure term is
+            cached by the pawn-only Zobrist key, so it is recomputed
+            only when a pawn actually moves or is captured.
+        """
+        score = 0
+        for index in range(12):
+            score += PIECE_VALUES[index] * popcount(self.bb[index])
+
+        pawn_score = self.pawn_cache.get(self.pawn_key)
+        if pawn_score is None:
+            pawn_score = self._pawn_structure_score()
+            if len(self.pawn_cache) >= CACHE_SIZE:
+                self.pawn_cache.clear()
+            self.pawn_cache[self.pawn_key] = pawn_score
+        score += pawn_score
+
+        if self.player_turn == 'white':
+            return score
+        return -score
+
+    def _gen_moves(self, color):
+        """
+            Return `color`'s pseudo-legal moves as (from_sq, to_sq)
+            pairs, captures first in most-valuable-victim /
+            least-valuable-attacker order
+        """
+        captures = []
+        quiets = []
+        if color == 'white':
+            bb, enemy_occ = self.occ_white, self.occ_black
+        else:
+            bb, enemy_occ = self.occ_black, self.occ_white
+        while bb:
+            sq = lsb(bb)
+            bb &= bb - 1
+            attacker = MVV_LVA_VALUES[PIECE_INDEX[self._sq[sq].abbreviation] % 6]
+            moves = self._pseudo_moves_bb(sq)
+            while moves:
+                bit = moves & -moves
+                dest = bit.bit_length() - 1
+                moves ^= bit
+                if enemy_occ & bit:
+                    victim = MVV_LVA_VALUES[
+                        PIECE_INDEX[self._sq[dest].abbreviation] % 6]
+                    captures.append((victim * 16 - attacker, (sq, dest)))
+                else:
+                    quiets.append((sq, dest))
+        captures.sort(reverse=True)
+        return [move for _, move in captures] + quiets
+
+    def search(self, depth, alpha=-INFINITY, beta=INFINITY):
+        """
+            Negamax alpha-beta search from the side to move's point of
+            view, with a Zobrist-keyed transposition table.  Checkmate
+            scores as -(MATE_VALUE + depth) so quicker mates win out.
+        """
+        key = self.position_key()
+        entry = self.transposition_table.get(key)
+        if entry is not None and entry[0] >= depth:
+            _, score, flag, _ = entry
+            if flag == TT_EXACT:
+                return score
+            if flag == TT_LOWER and score >= beta:
+                return score
+            if flag == TT_UPPER and score <= alpha:
+                return score
+
+        if depth == 0:
+            score = self.eval_cache.get(key)
+            if score is None:
+                score = self._evaluate()
+                if len(self.eval_cache) >= CACHE_SIZE:
+                    self.eval_cache.clear()
+                self.eval_cache[key] = score
+            return score
+
+        color = self.player_turn
+        alpha_orig = alpha
+        best_score = -INFINITY
+        best_move = None
+        legal_moves = 0
+        for from_sq, to_sq in self._gen_moves(color):
+            undo = self._make(SQ_TO_STR[from_sq], SQ_TO_STR[to_sq])
+            if self.is_in_check(color):
+                self._unmake(undo)
+                continue
+            legal_moves += 1
+            self.player_turn = self.get_enemy(color)
+            score = -self.search(depth - 1, -beta, -alpha)
+            self.player_turn = color
+            self._unmake(undo)
+            if score > best_score:
+                best_score = score
+                best_move = (from_sq, to_sq)
+            if best_score > alpha:
+                alpha = best_score
+            if alpha >= beta:
+                break
+
+        if legal_moves == 0:
+            if self.is_in_check(color):
+                return -MATE_VALUE - depth
+            return 0  # stalemate
+
+        if best_score <= alpha_orig:
+            flag = TT_UPPER
+        elif best_score >= beta:
+            flag = TT_LOWER
+        else:
+            flag = TT_EXACT
+        self.transposition_table[key] = (depth, best_score, flag, best_move)
+        return best_score
 
     def evaluate_board(self):
         """
@@ -256,40 +753,31 @@ class Board(dict):
         # If a side is in check
         if self.in_check[1]:
             side_in_check = self.in_check[0]
-            self.in_mate = (side_in_check, True)
-            # checks if the side in check has any possible moves that can escape the check
-            side_legal_moves = self.all_legal_side_moves(side_in_check)
-            if not side_legal_moves:
-                self.in_mate = ("", False)
-                return board_status  # if even 1 move is found in which the side in check escapes the check then return
-            
-            # If the side in check has no possible moves or cannot escape check then declare mate
-            if self.in_mate[1]:
+            # One-ply search: a mate score means the side to move (the
+            # side in check) has no move that escapes the check
+            if self.search(1) <= -MATE_VALUE:
+                self.in_mate = (side_in_check, True)
                 board_status = side_in_check + " is in checkmate!"
-                return board_status
+            else:
+                self.in_mate = ("", False)
         else:
             pass  # check if the enemy side has any legal moves left -if not => draw
             # need a function to tell me which side's turn it is
+        return board_status
 
     def letter_notation(self, coord):
         if not self.is_in_bounds(coord):
             return
-        try:
-            return self.axis_y[coord[1]] + str(self.axis_x[coord[0]])
-        except IndexError:
-            raise InvalidCoord
+        return SQ_TO_STR[coord[0] * 8 + coord[1]]
 
     def number_notation(self, coord):
         if coord is not None:
-            return int(coord[1])-1, self.axis_y.index(coord[0])
+            return divmod(STR_TO_SQ[coord], 8)
 
     @staticmethod
     def is_in_bounds(coord):
-        if coord[1] < 0 or coord[1] > 7 or\
-           coord[0] < 0 or coord[0] > 7:
-            return False
-        else:
-            return True
+        # Branchless: any coordinate outside 0..7 sets a bit above 7
+        return not ((coord[0] | coord[1]) & ~7)
 
     def load(self, fen):
         """
@@ -300,17 +788,16 @@ class Board(dict):
         fen = fen.split(' ')
 
         # Expand blanks
-        def expand(match): return ' ' * int(match.group(0))
-
-        fen[0] = re.compile(r'\d').sub(expand, fen[0])
+        fen[0] = ''.join(FEN_EXPAND.get(letter, letter) for letter in fen[0])
 
         for x, row in enumerate(fen[0].split('/')):
+            base = (x ^ 7) * 8  # FEN rows run rank 8 -> 1
             for y, letter in enumerate(row):
                 if letter == ' ':
                     continue
-                coord = self.letter_notation((7-x, y))
-                self[coord] = pieces.piece(letter)
-                self[coord].place(self)
+                _piece = pieces.piece(letter)
+                self._put(base + y, _piece)
+                _piece.place(self)
 
         if fen[1] == 'w':
             self.player_turn = 'white'
@@ -338,9 +825,8 @@ class Board(dict):
             return "".join(_result)
 
         result = ''
-        for number in self.axis_x[::-1]:
-            for letter in self.axis_y:
-                piece = self[letter+str(number)]
+        for rank in range(7, -1, -1):
+            for piece in self._sq[rank * 8:rank * 8 + 8]:
                 if piece is not None:
                     result += piece.abbreviation
                 else:
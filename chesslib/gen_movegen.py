@@ -0,0 +1,77 @@
+"""
+    Generates _movegen_generated.py: one specialized pawn-move function
+    per (color, square) with every mask folded in as a constant, so the
+    hot path runs no per-call square arithmetic or rank branches.
+
+    Run from the repository root whenever the move rules change:
+
+        python chesslib/gen_movegen.py
+"""
+import os
+
+HEADER = '''"""
+    Auto-generated by gen_movegen.py - do not edit by hand.
+
+    WHITE_PAWN_MOVES / BLACK_PAWN_MOVES hold one function per source
+    square taking (occ_all, enemy_occ) and returning the destination
+    bitboard, with all masks precomputed as constants.
+"""
+'''
+
+
+def pawn_attack_mask(sq, direction):
+    row, col = divmod(sq, 8)
+    mask = 0
+    for dc in (-1, 1):
+        r, c = row + direction, col + dc
+        if 0 <= r <= 7 and 0 <= c <= 7:
+            mask |= 1 << (r * 8 + c)
+    return mask
+
+
+def pawn_function(sq, color):
+    direction = 1 if color == 'white' else -1
+    homerow = 1 if color == 'white' else 6
+    name = '_%s_pawn_%d' % (color, sq)
+    attacks = pawn_attack_mask(sq, direction)
+    row = sq // 8
+    push_sq = sq + direction * 8
+    lines = ['def %s(occ_all, enemy_occ):' % name]
+    if not 0 <= push_sq <= 63:
+        # Pawn on the last rank: nothing to generate
+        lines.append('    return 0')
+        return name, '\n'.join(lines)
+    lines.append('    moves = %#x & enemy_occ' % attacks)
+    lines.append('    if not occ_all & %#x:' % (1 << push_sq))
+    lines.append('        moves |= %#x' % (1 << push_sq))
+    if row == homerow:
+        double_sq = sq + direction * 16
+        lines.append('        if not occ_all & %#x:' % (1 << double_sq))
+        lines.append('            moves |= %#x' % (1 << double_sq))
+    lines.append('    return moves')
+    return name, '\n'.join(lines)
+
+
+def generate():
+    chunks = [HEADER]
+    tables = {}
+    for color in ('white', 'black'):
+        names = []
+        for sq in range(64):
+            name, source = pawn_function(sq, color)
+            names.append(name)
+            chunks.append(source)
+        tables[color] = names
+    chunks.append('WHITE_PAWN_MOVES = (\n    %s,\n)' %
+                  ',\n    '.join(tables['white']))
+    chunks.append('BLACK_PAWN_MOVES = (\n    %s,\n)' %
+                  ',\n    '.join(tables['black']))
+    return '\n\n\n'.join(chunks) + '\n'
+
+
+if __name__ == '__main__':
+    target = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                          '_movegen_generated.py')
+    with open(target, 'w') as out:
+        out.write(generate())
+    print('wrote ' + target)
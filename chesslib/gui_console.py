@@ -1,7 +1,8 @@
 # -*- encoding: utf-8 -*-
-import board
 import os
 
+from chesslib import board
+
 UNICODE_PIECES = {
   'r': u'♜', 'n': u'♞', 'b': u'♝', 'q': u'♛',
   'k': u'♚', 'p': u'♟', 'R': u'♖', 'N': u'♘',
@@ -21,12 +22,12 @@ class BoardGuiConsole(object):
     def move(self):
         os.system("clear")
         self.unicode_representation()
-        print "\n", self.error
-        print "State a move in chess notation (e.g. A2A3). Type \"exit\" to leave:\n", ">>>",
+        print("\n" + self.error)
+        print("State a move in chess notation (e.g. A2A3). Type \"exit\" to leave:")
         self.error = ''
-        coord = raw_input()
+        coord = input(">>> ")
         if coord == "exit":
-            print "Bye."
+            print("Bye.")
             exit(0)
         try:
             if len(coord) != 4: raise board.InvalidCoord
@@ -38,16 +39,17 @@ class BoardGuiConsole(object):
         self.move()
 
     def unicode_representation(self):
-        print "\n", ("%s's turn\n" % self.board.player_turn.capitalize()).center(28)
+        print("\n" + ("%s's turn\n" % self.board.player_turn.capitalize()).center(28))
         for number in self.board.axis_x[::-1]:
-            print " " + str(number) + " ",
+            print(" " + str(number) + " ", end=' ')
             for letter in self.board.axis_y:
                 piece = self.board[letter+str(number)]
                 if piece is not None:
-                    print UNICODE_PIECES[piece.abbriviation] + ' ',
-                else: print '  ',
-            print "\n"
-        print "    " + "  ".join(self.board.axis_y)
+                    print(UNICODE_PIECES[piece.abbreviation] + ' ', end=' ')
+                else:
+                    print('  ', end=' ')
+            print("\n")
+        print("    " + "  ".join(self.board.axis_y))
 
 
 def display(board):
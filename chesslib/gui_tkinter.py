@@ -1,6 +1,7 @@
-import board
-# import pieces
-import Tkinter as tk
+import tkinter as tk
+
+from chesslib import board
+# from chesslib import pieces
 from PIL import ImageTk  # Image,
 
 ########
@@ -9,11 +10,9 @@ import time
 
 
 class BoardGuiTk(tk.Frame):
-    pieces = {}
     selected = None
     selected_piece = None
     hilighted = None
-    icons = {}
 
     color1 = "white"
     color2 = "grey"
@@ -31,6 +30,10 @@ class BoardGuiTk(tk.Frame):
         self.chessboard = chessboard
         self.square_size = square_size
         self.parent = parent
+        # Checkerboard fill colors, computed once
+        self.square_colors = [[self.color1 if (row + col) % 2 == 0 else self.color2
+                               for col in range(self.columns)]
+                              for row in range(self.rows)]
 
         canvas_width = self.columns * square_size
         canvas_height = self.rows * square_size
@@ -40,6 +43,18 @@ class BoardGuiTk(tk.Frame):
         self.canvas = tk.Canvas(self, width=canvas_width, height=canvas_height, background="grey")
         self.canvas.pack(side="top", fill="both", anchor="c", expand=True)
 
+        # Load all 12 piece icons once and pre-create one reusable
+        # canvas image item per square; draw_pieces only reconfigures
+        # them instead of creating/destroying items every move
+        self.icons = {}
+        for color in ('white', 'black'):
+            for abbr in ('p', 'n', 'b', 'r', 'q', 'k'):
+                self.icons[(color, abbr)] = ImageTk.PhotoImage(
+                    file="img/%s%s.png" % (color, abbr), width=32, height=32)
+        self.piece_items = [self.canvas.create_image(0, 0, tags="piece",
+                                                     anchor="c", state="hidden")
+                            for _ in range(64)]
+
         self.canvas.bind("<Configure>", self.refresh)
         self.canvas.bind("<Button-1>", self.click)
 
@@ -62,36 +77,38 @@ class BoardGuiTk(tk.Frame):
         # Figure out which square we've clicked
         col_size = row_size = event.widget.master.square_size
 
-        current_column = event.x / col_size
-        current_row = 7 - (event.y / row_size)
+        current_column = event.x // col_size
+        current_row = 7 - (event.y // row_size)
 
         position = self.chessboard.letter_notation((current_row, current_column))
         # piece = self.chessboard[position]
 
         if self.selected_piece:
-            if self.chessboard.number_notation(position) != self.selected:
+            # position is None for clicks outside the board
+            if position is not None and \
+                    self.chessboard.number_notation(position) != self.selected:
                 self.move(self.selected_piece[1], position)
             self.selected = None
             self.selected_piece = None
             self.hilighted = None
-            self.pieces = {}
             self.refresh()
-            self.draw_pieces()
             return
-            
+
         self.hilight(position)
         self.refresh()
 
     def move(self, p1, p2):
-        piece = self.chessboard[p1]
-        dest_piece = self.chessboard[p2]
+        piece = self.chessboard.get(p1)
+        dest_piece = self.chessboard.get(p2)
+        if piece is None:
+            return
         if dest_piece is None or dest_piece.color != piece.color:
             try:
                 self.chessboard.move(p1, p2)
                 # evaluate the board for a checkmate after each move
                 start = time.time()
                 evaluation = self.chessboard.evaluate_board()
-                print time.time() - start, 's evaluation'
+                print(time.time() - start, 's evaluation')
                 if evaluation != "":
                     self.label_status["text"] = evaluation
                     return
@@ -101,27 +118,16 @@ class BoardGuiTk(tk.Frame):
                 self.label_status["text"] = " " + piece.color.capitalize() + ": " + p1 + p2
 
     def hilight(self, pos):
-        piece = self.chessboard[pos]
+        piece = self.chessboard.get(pos)
         if piece is not None and (piece.color == self.chessboard.player_turn):
             self.selected = self.chessboard.number_notation(pos)
             self.selected_piece = (self.chessboard[pos], pos)
             # only highlights legal moves and NOT all possible piece moves
             start = time.time()
             piece_legal_moves = self.chessboard.all_legal_piece_moves(pos)
-            print time.time() - start, 's highlight'
-            self.hilighted = map(self.chessboard.number_notation, piece_legal_moves)    
-
-    def addpiece(self, name, image, row=0, column=0):
-        # Add a piece to the playing board
-        self.canvas.create_image(0, 0, image=image, tags=(name, "piece"), anchor="c")
-        self.placepiece(name, row, column)
-
-    def placepiece(self, name, row, column):
-        # Place a piece at the given row/column
-        self.pieces[name] = (row, column)
-        x0 = (column * self.square_size) + int(self.square_size/2)
-        y0 = ((7-row) * self.square_size) + int(self.square_size/2)
-        self.canvas.coords(name, x0, y0)
+            print(time.time() - start, 's highlight')
+            # a set makes the per-square membership test in refresh O(1)
+            self.hilighted = set(map(self.chessboard.number_notation, piece_legal_moves))
 
     def refresh(self, event=None):
         # Redraw the board
@@ -131,46 +137,46 @@ class BoardGuiTk(tk.Frame):
             self.square_size = min(xsize, ysize)
 
         self.canvas.delete("square")
-        color = self.color2
+        # Everything loop-invariant is computed once, not per square
+        king_pos_num = None
+        if self.chessboard.in_check[1]:
+            king_pos_letter = self.chessboard.get_king_position(self.chessboard.in_check[0])
+            king_pos_num = self.chessboard.number_notation(king_pos_letter)
+        selected = self.selected
+        hilighted = self.hilighted
+        square_size = self.square_size
         for row in range(self.rows):
-            color = self.color1 if color == self.color2 else self.color2
             for col in range(self.columns):
-                x1 = (col * self.square_size)
-                y1 = ((7-row) * self.square_size)
-                x2 = x1 + self.square_size
-                y2 = y1 + self.square_size
-                if (self.selected is not None) and (row, col) == self.selected:
-                    self.canvas.create_rectangle(x1, y1, x2, y2, outline="black", fill="orange", tags="square")
-                elif self.hilighted is not None and (row, col) in self.hilighted:
-                    self.canvas.create_rectangle(x1, y1, x2, y2, outline="black", fill="spring green", tags="square")
+                x1 = col * square_size
+                y1 = (7-row) * square_size
+                x2 = x1 + square_size
+                y2 = y1 + square_size
+                if (row, col) == king_pos_num:
+                    fill = "red"
+                elif (selected is not None) and (row, col) == selected:
+                    fill = "orange"
+                elif hilighted is not None and (row, col) in hilighted:
+                    fill = "spring green"
                 else:
-                    self.canvas.create_rectangle(x1, y1, x2, y2, outline="black", fill=color, tags="square")
-
-                if self.chessboard.in_check[1]:
-                    king_pos_letter = self.chessboard.get_king_position(self.chessboard.in_check[0])
-                    king_pos_num = self.chessboard.number_notation(king_pos_letter)
-                    if (row, col) == king_pos_num:
-                        self.canvas.create_rectangle(x1, y1, x2, y2, outline="black", fill="red", tags="square")
-
-                color = self.color1 if color == self.color2 else self.color2
-        for name in self.pieces:
-            self.placepiece(name, self.pieces[name][0], self.pieces[name][1])
+                    fill = self.square_colors[row][col]
+                self.canvas.create_rectangle(x1, y1, x2, y2, outline="black", fill=fill, tags="square")
+        self.draw_pieces()
         self.canvas.tag_raise("piece")
         self.canvas.tag_lower("square")
 
     def draw_pieces(self):
-        self.canvas.delete("piece")
-        for coord, piece in self.chessboard.iteritems():
-            x, y = self.chessboard.number_notation(coord)
-            if piece is not None:
-                filename = "img/%s%s.png" % (piece.color, piece.abbreviation.lower())
-                piecename = "%s%s%s" % (piece.abbreviation, x, y)
-
-                if filename not in self.icons:
-                    self.icons[filename] = ImageTk.PhotoImage(file=filename, width=32, height=32)
-
-                self.addpiece(piecename, self.icons[filename], x, y)
-                self.placepiece(piecename, x, y)
+        half_square = int(self.square_size/2)
+        for sq, item in enumerate(self.piece_items):
+            piece = self.chessboard[sq]
+            if piece is None:
+                self.canvas.itemconfigure(item, state="hidden")
+            else:
+                icon = self.icons[(piece.color, piece.abbreviation.lower())]
+                self.canvas.itemconfigure(item, image=icon, state="normal")
+                row, col = divmod(sq, 8)
+                x0 = (col * self.square_size) + half_square
+                y0 = ((7-row) * self.square_size) + half_square
+                self.canvas.coords(item, x0, y0)
 
     def reset(self):
         # remove the following from here ###########
@@ -178,8 +184,6 @@ class BoardGuiTk(tk.Frame):
 
         self.chessboard.load(board.FEN_STARTING)
         self.refresh()
-        self.draw_pieces()
-        self.refresh()
 
 
 def display(chessboard):
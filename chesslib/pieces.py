@@ -20,7 +20,7 @@ class InvalidColor(Exception):
 
 
 def piece(_piece, color='white'):
-    """ 
+    """
     Takes a piece name or abbreviation and returns the corresponding piece instance
     """
     if _piece in (None, ' '):
@@ -59,37 +59,11 @@ class Piece(object):
         """
         self.board = board
 
-    def possible_moves(self, position, orthogonal, diagonal, distance):
-        board = self.board
-        legal_moves = []
-        orth = ((-1, 0), (0, -1), (0, 1), (1, 0))
-        diag = ((-1, -1), (-1, 1), (1, -1), (1, 1))
-        piece = self
-
-        from_ = board.number_notation(position)
-        if orthogonal and diagonal:
-            directions = diag+orth
-        elif diagonal:
-            directions = diag
-        elif orthogonal:
-            directions = orth
-
-        for x, y in directions:
-            collision = False
-            for step in range(1, distance+1):
-                if collision:
-                    break
-                dest = from_[0]+step*x, from_[1]+step*y
-                if self.board.letter_notation(dest) not in board.occupied('white') + board.occupied('black'):
-                    legal_moves.append(dest)
-                elif self.board.letter_notation(dest) in board.occupied(piece.color):
-                    collision = True
-                else:
-                    legal_moves.append(dest)
-                    collision = True
-
-        legal_moves = filter(board.is_in_bounds, legal_moves)
-        return map(board.letter_notation, legal_moves)
+    def possible_moves(self, position):
+        """
+        Delegate to the board's precomputed attack tables
+        """
+        return self.board.pseudo_moves(position)
 
     def __str__(self):
         return self.abbreviation
@@ -101,91 +75,22 @@ class Piece(object):
 class Pawn(Piece):
     abbreviation = 'p'
 
-    def possible_moves(self, position):
-        board = self.board
-        position = position.upper()
-
-        if self.color == 'white':
-            homerow, direction, enemy = 1, 1, 'black'
-        else:
-            homerow, direction, enemy = 6, -1, 'white'
-
-        legal_moves = []
-
-        # Moving
-
-        blocked = board.occupied('white') + board.occupied('black')
-        from_ = board.number_notation(position)
-        forward = from_[0] + direction, from_[1]
-
-        # Can we move forward?
-        if board.letter_notation(forward) not in blocked:
-            legal_moves.append(forward)
-            if from_[0] == homerow:
-                # If pawn in starting position we can do a double move
-                double_forward = (forward[0] + direction, forward[1])
-                if board.letter_notation(double_forward) not in blocked:
-                    legal_moves.append(double_forward)
-
-        # Attacking
-        for a in range(-1, 2, 2):
-            attack = from_[0] + direction, from_[1] + a
-            if board.letter_notation(attack) in board.occupied(enemy):
-                legal_moves.append(attack)
-
-        # TODO: En passant
-        legal_moves = filter(board.is_in_bounds, legal_moves)
-        return map(board.letter_notation, legal_moves)
-
 
 class Knight(Piece):
     abbreviation = 'n'
 
-    def possible_moves(self, position):
-        board = self.board
-        position = position.upper()
-        legal_moves = []
-        from_ = board.number_notation(position)
-        piece = board.get(position)
-        deltas = ((-2, -1), (-2, 1), (-1, -2), (-1, 2), (1, -2), (1, 2), (2, -1), (2, 1))
-
-        for x, y in deltas:
-            dest = from_[0]+x, from_[1]+y
-            if board.letter_notation(dest) not in board.occupied(piece.color):
-                legal_moves.append(dest)
-
-        legal_moves = filter(board.is_in_bounds, legal_moves)
-        return map(board.letter_notation, legal_moves)
-
 
 class Rook(Piece):
     abbreviation = 'r'
 
-    def possible_moves(self, position):
-        position = position.upper()
-        return super(Rook, self).possible_moves(position, True, False, 8)
-
 
 class Bishop(Piece):
     abbreviation = 'b'
 
-    def possible_moves(self, position):
-        position = position.upper()
-        return super(Bishop, self).possible_moves(position, False, True, 8)
-
 
 class Queen(Piece):
     abbreviation = 'q'
 
-    def possible_moves(self, position):
-        position = position.upper()
-        return super(Queen, self).possible_moves(position, True, True, 8)
-
 
 class King(Piece):
     abbreviation = 'k'
-    move_length = 1
-
-    def possible_moves(self, position):
-        position = position.upper()
-        return super(King, self).possible_moves(position, True, True, 1)
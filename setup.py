@@ -0,0 +1,23 @@
+#!/usr/bin/env python
+"""
+    Builds the optional C move-generation extension:
+
+        python setup.py build_ext --inplace
+
+    The game runs fine without it - board.py falls back to the
+    pure-Python kernels when the extension is missing.
+"""
+from distutils.core import setup
+from distutils.extension import Extension
+
+try:
+    from Cython.Build import cythonize
+    extensions = cythonize(
+        [Extension('chesslib._movegen', ['chesslib/_movegen.pyx'])])
+except ImportError:
+    extensions = []
+
+setup(
+    name='chess-python',
+    ext_modules=extensions,
+)